@@ -7,3 +7,6 @@ INFERENCE_SERVER_URL = os.getenv("INFERENCE_SERVER_URL")
 INCIDENT_WINDOW = 10
 UPLOAD_SECRET = os.getenv("UPLOAD_SECRET", "").encode()
 UPLOAD_URL = os.getenv("UPLOAD_URL")
+DETECTION_LOG_DIR = os.getenv("DETECTION_LOG_DIR", "detection_log")
+DETECTION_LOG_SEGMENT_ROWS = int(os.getenv("DETECTION_LOG_SEGMENT_ROWS", "65536"))
+DETECTION_LOG_MAX_SEGMENTS = int(os.getenv("DETECTION_LOG_MAX_SEGMENTS", "256"))
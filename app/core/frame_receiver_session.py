@@ -4,6 +4,7 @@ import cv2
 import numpy as np
 from fastapi import WebSocket, WebSocketDisconnect
 from app.services.buffer import buffer_frame
+from app.services.detection_log import detection_log
 from app.shared_state import camera_user_map, camera_buffers
 from app.inference.send_detection import send_detection_event
 
@@ -57,9 +58,12 @@ class FrameReceiverSession:
                 print(f"⚠️ Detection error cam {self.camera_id}: {e}")
                 continue
 
-            frame_with_boxes = self.detection_service.draw_boxes(frame, result["detections"])
-            
             if result["detections"]:
+                try:
+                    detection_log.append(self.camera_id, result["detections"])
+                except Exception as e:
+                    print(f"⚠️ Error logging detections cam {self.camera_id}: {e}")
+
                 try:
                     _, jpg_buffer = cv2.imencode('.jpg', frame)
                     jpg_bytes = jpg_buffer.tobytes()
@@ -77,7 +81,8 @@ class FrameReceiverSession:
                     print(f'✅ Detection event sent for camera {self.camera_id}')
                 except Exception as e:
                     print(f"⚠️ Error buffering frame for incident: {e}")
-            
+
+            frame_with_boxes = self.detection_service.draw_boxes(frame, result["detections"])
             self.buffer.update_frame(frame_with_boxes)
 
     async def _cleanup(self):
@@ -88,6 +93,7 @@ class FrameReceiverSession:
                 await task
 
         await self.detection_services[self.camera_id].client.close()
+        detection_log.flush()
         self.buffer.finished = True
         camera_buffers.pop(self.camera_id, None)
         self.detection_services.pop(self.camera_id, None)
@@ -4,6 +4,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from .routes.camera import router as camera_router
 from .routes.frame_receiver import router as frame_receiver_router
 from .routes.health import router as health_router
+from .routes.detections import router as detections_router
 
 app = FastAPI()
 
@@ -18,3 +19,4 @@ app.add_middleware(
 app.include_router(camera_router, prefix="/camera")
 app.include_router(frame_receiver_router, prefix="/frames")
 app.include_router(health_router, prefix="/health")
+app.include_router(detections_router, prefix="/detections")
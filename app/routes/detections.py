@@ -0,0 +1,23 @@
+import math
+import time
+from fastapi import APIRouter, HTTPException, Query
+from app.services.detection_log import detection_log
+
+router = APIRouter()
+
+@router.get("/{camera_id}")
+def detection_stats(
+    camera_id: int,
+    start: float | None = Query(None, description="Range start as a Unix timestamp; defaults to one hour before end"),
+    end: float | None = Query(None, description="Range end as a Unix timestamp; defaults to now"),
+    bucket: float | None = Query(None, gt=0, description="Optional histogram bucket width in seconds"),
+):
+    end = time.time() if end is None else end
+    start = end - 3600 if start is None else start
+    if not all(math.isfinite(v) for v in (start, end, bucket or 0)):
+        raise HTTPException(status_code=400, detail="start, end and bucket must be finite numbers")
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+    if bucket and (end - start) / bucket > 10_000:
+        raise HTTPException(status_code=400, detail="bucket too small for the requested range")
+    return detection_log.query(camera_id, start, end, bucket)
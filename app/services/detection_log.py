@@ -0,0 +1,298 @@
+import json
+import os
+import threading
+import time
+import numpy as np
+from typing import Any
+from app.config import DETECTION_LOG_DIR, DETECTION_LOG_SEGMENT_ROWS, DETECTION_LOG_MAX_SEGMENTS
+
+DETECTION_DTYPE = np.dtype([
+    ("timestamp", np.float64),
+    ("camera_id", np.int32),
+    ("label_id", np.int32),
+    ("confidence", np.float32),
+    ("box", np.float32, (4,)),
+])
+
+
+class Segment:
+    """One segment file. Only the active (last) segment keeps a writable mapping;
+    sealed segments carry their row count and time range in the filename."""
+
+    def __init__(self, path: str, count: int, first_ts: float, last_ts: float, rows: np.memmap | None = None):
+        self.path = path
+        self.count = count
+        self.first_ts = first_ts
+        self.last_ts = last_ts
+        self.rows = rows
+
+    @property
+    def full(self) -> bool:
+        return self.rows is None or self.count >= len(self.rows)
+
+    def append(self, rows: np.ndarray) -> int:
+        n = min(len(rows), len(self.rows) - self.count)
+        self.rows[self.count:self.count + n] = rows[:n]
+        if not self.count:
+            self.first_ts = float(rows["timestamp"][0])
+        self.count += n
+        self.last_ts = float(rows["timestamp"][n - 1])
+        return n
+
+    def seal(self) -> None:
+        # Rename to <index>-<count>-<first_ts>-<last_ts>.npy so reopening reads no file.
+        self.rows.flush()
+        self.rows = None
+        index = segment_index(os.path.basename(self.path))
+        sealed = os.path.join(os.path.dirname(self.path), f"{index:08d}-{self.count}-{self.first_ts!r}-{self.last_ts!r}.npy")
+        os.replace(self.path, sealed)
+        self.path = sealed
+
+    def open_rows(self) -> np.ndarray:
+        # Rows below count are never rewritten, so this is safe to read unlocked.
+        if self.rows is not None:
+            return self.rows[:self.count]
+        return np.load(self.path, mmap_mode="r")[:self.count]
+
+
+def segment_index(name: str) -> int | None:
+    stem = name[:-len(".npy")] if name.endswith(".npy") else ""
+    head = stem.split("-", 1)[0]
+    return int(head) if head.isdigit() else None
+
+
+class DetectionLog:
+    """Append-only per-camera detection log stored in memory-mapped .npy segments.
+
+    Rows are appended in timestamp order, so each segment is its own time index:
+    a range query binary-searches the segments that overlap it and aggregates
+    one segment at a time, keeping memory bounded by the segment size. Only the
+    segment snapshot is taken under the lock; appends never block on aggregation.
+    """
+
+    def __init__(self, root: str, segment_rows: int = DETECTION_LOG_SEGMENT_ROWS, max_segments: int = DETECTION_LOG_MAX_SEGMENTS):
+        self.root = root
+        self.segment_rows = segment_rows
+        self.max_segments = max_segments
+        self._segments: dict[int, list[Segment]] = {}
+        self._labels: dict[str, int] | None = None
+        self._next_label_id = 0
+        self._lock = threading.Lock()
+
+    def append(self, camera_id: int, detections: list[dict[str, Any]], timestamp: float | None = None) -> None:
+        if not detections:
+            return
+
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            segments = self._camera_segments(camera_id, create=True)
+            if segments and segments[-1].count:
+                # Keep each segment sorted even if the wall clock steps back.
+                timestamp = max(timestamp, segments[-1].last_ts)
+
+            rows = np.zeros(len(detections), dtype=DETECTION_DTYPE)
+            rows["timestamp"] = timestamp
+            rows["camera_id"] = camera_id
+            rows["label_id"] = [self._label_id(det.get("label", "object")) for det in detections]
+            rows["confidence"] = [det.get("confidence", 0.0) for det in detections]
+            rows["box"] = [det["box"] for det in detections]
+
+            while len(rows):
+                segment = segments[-1] if segments and not segments[-1].full else self._new_segment(camera_id)
+                rows = rows[segment.append(rows):]
+
+    def query(self, camera_id: int, start: float, end: float, bucket: float | None = None) -> dict[str, Any]:
+        with self._lock:
+            # Sealed segments are only opened below, outside the lock, and dropped after use.
+            overlapping = [
+                Segment(s.path, s.count, s.first_ts, s.last_ts, s.rows[:s.count] if s.rows is not None else None)
+                for s in self._camera_segments(camera_id)
+                if s.count and s.first_ts <= end and s.last_ts >= start
+            ]
+            names = {label_id: label for label, label_id in self._load_labels().items()}
+            n_labels = self._next_label_id
+
+        # At least one bucket, so a zero-width range still places every counted row.
+        n_buckets = max(1, int(np.ceil((end - start) / bucket))) if bucket else 0
+        counts = np.zeros(n_labels, dtype=np.int64)
+        conf_sum = np.zeros(n_labels, dtype=np.float64)
+        conf_max = np.zeros(n_labels, dtype=np.float32)
+        bucket_counts = np.zeros(n_buckets, dtype=np.int64)
+
+        for segment in overlapping:
+            try:
+                rows = segment.open_rows()
+            except (OSError, ValueError) as e:
+                # Retention may have removed it since the snapshot.
+                print(f"⚠️ Skipping unreadable detection log segment {segment.path}: {e}")
+                continue
+            timestamps = rows["timestamp"]
+            rows = rows[np.searchsorted(timestamps, start, side="left"):np.searchsorted(timestamps, end, side="right")]
+            if not len(rows):
+                continue
+            label_ids = rows["label_id"]
+            confidence = rows["confidence"]
+            counts += np.bincount(label_ids, minlength=n_labels)
+            conf_sum += np.bincount(label_ids, weights=confidence, minlength=n_labels)
+            np.maximum.at(conf_max, label_ids, confidence)
+            if n_buckets:
+                idx = ((rows["timestamp"] - start) // bucket).astype(np.int64)
+                bucket_counts += np.bincount(np.minimum(idx, n_buckets - 1), minlength=n_buckets)
+
+        present = np.flatnonzero(counts)
+        labels = {
+            names.get(i, f"label_{i}"): {
+                "count": int(counts[i]),
+                "mean_confidence": float(conf_sum[i] / counts[i]),
+                "max_confidence": float(conf_max[i]),
+            }
+            for i in present
+        }
+        result = {
+            "camera_id": camera_id,
+            "start": start,
+            "end": end,
+            "total": int(counts.sum()),
+            "labels": labels,
+        }
+        if bucket:
+            result["bucket"] = bucket
+            result["buckets"] = bucket_counts.tolist()
+        return result
+
+    def flush(self) -> None:
+        with self._lock:
+            for segments in self._segments.values():
+                if segments and segments[-1].rows is not None:
+                    segments[-1].rows.flush()
+
+    def _camera_dir(self, camera_id: int) -> str:
+        return os.path.join(self.root, str(camera_id))
+
+    def _camera_segments(self, camera_id: int, create: bool = False) -> list[Segment]:
+        segments = self._segments.get(camera_id)
+        if segments is not None:
+            return segments
+
+        segments = []
+        camera_dir = self._camera_dir(camera_id)
+        if not os.path.isdir(camera_dir) and not create:
+            # Don't remember cameras that were only queried, or arbitrary IDs would pile up.
+            return segments
+        if os.path.isdir(camera_dir):
+            names = sorted(
+                (index, name) for name in os.listdir(camera_dir)
+                if (index := segment_index(name)) is not None
+            )
+            for _, name in names:
+                path = os.path.join(camera_dir, name)
+                try:
+                    segment = self._open_segment(path)
+                except (OSError, ValueError) as e:
+                    print(f"⚠️ Skipping unreadable detection log segment {path}: {e}")
+                    continue
+                if segment is not None:
+                    segments.append(segment)
+            # Only the newest segment stays writable; older unsealed ones are leftovers.
+            for segment in segments[:-1]:
+                if segment.rows is not None:
+                    segment.seal()
+        self._segments[camera_id] = segments
+        return segments
+
+    def _open_segment(self, path: str) -> Segment | None:
+        parts = os.path.basename(path)[:-len(".npy")].split("-")
+        if len(parts) == 4:
+            # Sealed: row count and time range are in the name, nothing to open.
+            return Segment(path, int(parts[1]), float(parts[2]), float(parts[3]))
+
+        rows = np.load(path, mmap_mode="r+")
+        if rows.dtype != DETECTION_DTYPE:
+            print(f"⚠️ Skipping detection log segment with unexpected layout: {path}")
+            return None
+        timestamps = rows["timestamp"]
+        count = len(rows)
+        if count and timestamps[-1] == 0:
+            # Unused rows are zero-filled, so the first zero timestamp marks the end.
+            count = int(np.argmax(timestamps == 0))
+        first_ts = float(timestamps[0]) if count else 0.0
+        last_ts = float(timestamps[count - 1]) if count else 0.0
+        return Segment(path, count, first_ts, last_ts, rows)
+
+    def _new_segment(self, camera_id: int) -> Segment:
+        segments = self._segments[camera_id]
+        if segments and segments[-1].rows is not None:
+            segments[-1].seal()
+
+        camera_dir = self._camera_dir(camera_id)
+        os.makedirs(camera_dir, exist_ok=True)
+        # Number past every file on disk, including skipped ones, so none is overwritten.
+        index = max((i for name in os.listdir(camera_dir) if (i := segment_index(name)) is not None), default=-1) + 1
+        path = os.path.join(camera_dir, f"{index:08d}.npy")
+        rows = np.lib.format.open_memmap(path, mode="w+", dtype=DETECTION_DTYPE, shape=(self.segment_rows,))
+        segment = Segment(path, 0, 0.0, 0.0, rows)
+        segments.append(segment)
+
+        while len(segments) > self.max_segments:
+            os.remove(segments.pop(0).path)
+        return segment
+
+    def _labels_path(self) -> str:
+        return os.path.join(self.root, "labels.json")
+
+    def _load_labels(self) -> dict[str, int]:
+        if self._labels is not None:
+            return self._labels
+
+        labels = {}
+        try:
+            with open(self._labels_path()) as f:
+                labels = json.load(f)
+            if not isinstance(labels, dict):
+                raise ValueError("label map is not an object")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring unreadable detection label map {self._labels_path()}: {e}")
+            labels = {}
+
+        self._labels = labels
+        self._next_label_id = max(labels.values(), default=-1) + 1
+        if not labels:
+            # A lost map must not hand out IDs that existing segments already use.
+            self._next_label_id = self._max_logged_label_id() + 1
+        return labels
+
+    def _max_logged_label_id(self) -> int:
+        max_id = -1
+        if not os.path.isdir(self.root):
+            return max_id
+        for camera in os.listdir(self.root):
+            camera_dir = os.path.join(self.root, camera)
+            if not os.path.isdir(camera_dir):
+                continue
+            for name in os.listdir(camera_dir):
+                if not name.endswith(".npy"):
+                    continue
+                try:
+                    rows = np.load(os.path.join(camera_dir, name), mmap_mode="r")
+                except (OSError, ValueError):
+                    continue
+                if rows.dtype == DETECTION_DTYPE and len(rows):
+                    max_id = max(max_id, int(rows["label_id"].max()))
+        return max_id
+
+    def _label_id(self, label: str) -> int:
+        labels = self._load_labels()
+        label_id = labels.get(label)
+        if label_id is None:
+            label_id = labels[label] = self._next_label_id
+            self._next_label_id += 1
+            os.makedirs(self.root, exist_ok=True)
+            tmp_path = self._labels_path() + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(labels, f)
+            os.replace(tmp_path, self._labels_path())
+        return label_id
+
+detection_log = DetectionLog(DETECTION_LOG_DIR)
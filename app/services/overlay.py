@@ -0,0 +1,122 @@
+import cv2
+import numpy as np
+from collections import OrderedDict
+from typing import Any
+
+BOX_COLOR = (0, 255, 0)
+BOX_THICKNESS = 2
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+FONT_SCALE = 0.5
+FONT_THICKNESS = 8
+LABEL_OFFSET = 10
+SPRITE_CACHE_SIZE = 1024
+
+
+class LabelSprite:
+    def __init__(self, alpha: np.ndarray, origin: tuple[int, int]):
+        self.origin = origin
+        self.shape = alpha.shape
+        color = np.empty((*alpha.shape, 3), dtype=np.uint8)
+        color[:] = BOX_COLOR
+        # Builds that antialias text need a real blend; otherwise a masked copy is enough.
+        if ((alpha > 0) & (alpha < 255)).any():
+            alpha3 = cv2.merge([alpha] * 3)
+            premultiplied = cv2.multiply(color, alpha3, scale=1 / 255)
+            self.blit = (premultiplied, None, 255 - alpha3, np.empty_like(alpha3))
+        else:
+            self.blit = (color, (alpha == 255).astype(np.uint8), None, None)
+
+    def clipped(self, rows: slice, cols: slice) -> tuple:
+        return tuple(None if part is None else part[rows, cols] for part in self.blit)
+
+
+class OverlayRenderer:
+    """Draws detection boxes in place, blitting cached pre-rendered label sprites.
+
+    Labels are rasterized once per distinct text and cropped to their ink; each
+    frame draws all box outlines in one call and copies the sprites straight into
+    the frame through their cached masks (or blends them in place through
+    preallocated buffers on builds that antialias text). Sprite placements are
+    reused while the detection set stays the same.
+    """
+
+    def __init__(self, sprite_cache_size: int = SPRITE_CACHE_SIZE):
+        self._sprites: OrderedDict[str, LabelSprite] = OrderedDict()
+        self._sprite_cache_size = sprite_cache_size
+        self._layout_key: tuple | None = None
+        self._outlines = np.empty((0, 4, 2), dtype=np.int32)
+        self._blits: list[tuple] = []
+
+    def render(self, frame: np.ndarray, detections: list[dict[str, Any]]) -> np.ndarray:
+        if not detections:
+            return frame
+
+        key = (frame.shape, self._detections_key(detections))
+        if key != self._layout_key:
+            self._build_layout(key[1], frame.shape)
+            self._layout_key = key
+
+        # Everything shares one color and the outlines are opaque, so drawing all of
+        # them in one call before the labels gives the same pixels as cv2.rectangle
+        # interleaved with putText.
+        cv2.polylines(frame, self._outlines, True, BOX_COLOR, BOX_THICKNESS)
+        for y0, y1, x0, x1, (source, mask, inv_alpha, scratch) in self._blits:
+            roi = frame[y0:y1, x0:x1]
+            if inv_alpha is None:
+                cv2.copyTo(source, mask, roi)
+            else:
+                cv2.multiply(roi, inv_alpha, dst=scratch, scale=1 / 255)
+                cv2.add(scratch, source, dst=roi)
+        return frame
+
+    @staticmethod
+    def _detections_key(detections: list[dict[str, Any]]) -> tuple:
+        key = []
+        for det in detections:
+            x1, y1, x2, y2 = map(int, det["box"])
+            label = det.get("label", "object")
+            confidence = det.get("confidence", 0.0)
+            key.append((x1, y1, x2, y2, f"{label}: {confidence:.2f}"))
+        return tuple(key)
+
+    def _build_layout(self, boxes: tuple, shape: tuple[int, ...]) -> None:
+        height, width = shape[:2]
+        corners = np.array([box[:4] for box in boxes], dtype=np.int32)
+        x1, y1, x2, y2 = corners.T
+        self._outlines = np.stack([x1, y1, x2, y1, x2, y2, x1, y2], axis=1).reshape(-1, 4, 2)
+
+        blits = []
+        for bx1, by1, _, _, text in boxes:
+            sprite = self._get_sprite(text)
+            ox, oy = sprite.origin
+            top, left = by1 - LABEL_OFFSET - oy, bx1 - ox
+            sh, sw = sprite.shape
+            if top >= 0 and left >= 0 and top + sh <= height and left + sw <= width:
+                blits.append((top, top + sh, left, left + sw, sprite.blit))
+                continue
+
+            rows = slice(max(-top, 0), min(sh, height - top))
+            cols = slice(max(-left, 0), min(sw, width - left))
+            if rows.start < rows.stop and cols.start < cols.stop:
+                blits.append((top + rows.start, top + rows.stop, left + cols.start, left + cols.stop, sprite.clipped(rows, cols)))
+        self._blits = blits
+
+    def _get_sprite(self, text: str) -> LabelSprite:
+        sprite = self._sprites.get(text)
+        if sprite is not None:
+            self._sprites.move_to_end(text)
+            return sprite
+
+        (text_w, text_h), baseline = cv2.getTextSize(text, FONT, FONT_SCALE, FONT_THICKNESS)
+        pad = FONT_THICKNESS * 2
+        alpha = np.zeros((text_h + baseline + 2 * pad, text_w + 2 * pad), dtype=np.uint8)
+        origin = (pad, pad + text_h)
+        cv2.putText(alpha, text, origin, FONT, FONT_SCALE, 255, FONT_THICKNESS)
+
+        # Crop to the inked area so blits only touch pixels the label covers.
+        x, y, w, h = cv2.boundingRect(alpha)
+        sprite = LabelSprite(alpha[y:y + h, x:x + w].copy(), (origin[0] - x, origin[1] - y))
+        self._sprites[text] = sprite
+        if len(self._sprites) > self._sprite_cache_size:
+            self._sprites.popitem(last=False)
+        return sprite
@@ -0,0 +1,111 @@
+"""Compare the legacy copy + rectangle/putText overlay with OverlayRenderer.
+
+Run from the repository root:
+
+    python -m benchmarks.overlay_bench [--boxes 20 200] [--frames 200]
+"""
+import argparse
+import random
+import time
+import cv2
+import numpy as np
+from app.services.overlay import OverlayRenderer
+
+LABELS = ["gun", "knife", "person", "weapon", "object"]
+FRAME_SHAPE = (1080, 1920, 3)
+# Antialiased label edges may round differently by one intensity level.
+MAX_DIFFERENCE = 1
+
+
+def legacy_draw_boxes(frame: np.ndarray, detections: list[dict]) -> np.ndarray:
+    frame_copy = frame.copy()
+    for det in detections:
+        x1, y1, x2, y2 = map(int, det["box"])
+        label = det.get("label", "object")
+        confidence = det.get("confidence", 0.0)
+
+        color = (0, 255, 0)
+        cv2.rectangle(frame_copy, (x1, y1), (x2, y2), color, 2)
+        text = f"{label}: {confidence:.2f}"
+        cv2.putText(frame_copy, text, (x1, y1 - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 8)
+
+    return frame_copy
+
+
+def make_detections(rng: random.Random, n: int) -> list[dict]:
+    height, width = FRAME_SHAPE[:2]
+    detections = []
+    for _ in range(n):
+        x1, y1 = rng.uniform(0, width - 150), rng.uniform(30, height - 120)
+        detections.append({
+            "box": [x1, y1, x1 + rng.uniform(40, 150), y1 + rng.uniform(40, 120)],
+            "label": rng.choice(LABELS),
+            "confidence": rng.random(),
+        })
+    return detections
+
+
+def jitter(rng: random.Random, detections: list[dict]) -> list[dict]:
+    # Inference runs on every frame: boxes move a little and confidences change.
+    moved = []
+    for det in detections:
+        dx, dy = rng.uniform(0, 2), rng.uniform(0, 2)
+        x1, y1, x2, y2 = det["box"]
+        moved.append({**det, "box": [x1 + dx, y1 + dy, x2 + dx, y2 + dy], "confidence": rng.random()})
+    return moved
+
+
+def max_difference(renderer: OverlayRenderer, frame: np.ndarray, detections: list[dict]) -> int:
+    expected = legacy_draw_boxes(frame, detections).astype(np.int16)
+    rendered = renderer.render(frame.copy(), detections).astype(np.int16)
+    return int(np.abs(expected - rendered).max())
+
+
+def time_per_frame(draw, frames: np.ndarray, detection_sets: list[list[dict]]) -> float:
+    start = time.perf_counter()
+    for i, detections in enumerate(detection_sets):
+        draw(frames[i % len(frames)], detections)
+    return (time.perf_counter() - start) / len(detection_sets) * 1e3
+
+
+def run(n_boxes: int, n_frames: int, seed: int) -> bool:
+    rng = random.Random(seed)
+    np_rng = np.random.default_rng(seed)
+    frames = np_rng.integers(0, 256, size=(4, *FRAME_SHAPE), dtype=np.uint8)
+    base = make_detections(rng, n_boxes)
+    cases = {
+        "unchanged": [base] * n_frames,
+        "changing": [base := jitter(rng, base) for _ in range(n_frames)],
+    }
+
+    matches = True
+    for case, detection_sets in cases.items():
+        renderer = OverlayRenderer()
+        # Warm the sprite cache the same way a running camera would.
+        time_per_frame(renderer.render, frames.copy(), detection_sets[:20])
+        legacy = time_per_frame(legacy_draw_boxes, frames, detection_sets)
+        rendered = time_per_frame(renderer.render, frames.copy(), detection_sets)
+        diff = max(max_difference(renderer, frames[0], detections) for detections in detection_sets[:5])
+        matches &= diff <= MAX_DIFFERENCE
+        print(
+            f"{n_boxes:>4} boxes  {case:<9}  legacy {legacy:7.2f} ms  renderer {rendered:7.2f} ms  "
+            f"speedup {legacy / rendered:5.1f}x  max diff {diff}"
+        )
+    return matches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--boxes", type=int, nargs="+", default=[20, 200])
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"opencv {cv2.__version__}, frame {FRAME_SHAPE[1]}x{FRAME_SHAPE[0]}")
+    matches = [run(n_boxes, args.frames, args.seed) for n_boxes in args.boxes]
+    if not all(matches):
+        raise SystemExit(f"renderer output differs from the legacy path by more than {MAX_DIFFERENCE}")
+
+
+if __name__ == "__main__":
+    main()